@@ -6,13 +6,15 @@
 
 import csv
 import json
+import queue
 import threading
+import time
 import gettext
 
 import gi
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-from gi.repository import Gtk, Adw, Gio, GLib, Pango, Gdk
+from gi.repository import Gtk, Adw, Gio, GLib, GObject, Pango, Gdk
 
 from langpack_inspector.backend import (
     get_system_language,
@@ -24,27 +26,109 @@ from langpack_inspector.backend import (
 
 _ = gettext.gettext
 
+# Coalesce this many ms of typing into one filter pass
+_FILTER_DEBOUNCE_MS = 150
+
+_counts_tpl = None
+
+
+def _get_counts_tpl():
+    """Translated counts template, looked up once instead of per row."""
+    global _counts_tpl
+    if _counts_tpl is None:
+        _counts_tpl = _("{translated}/{total} ({pct:.0f}%)")
+    return _counts_tpl
+
+
+_stats_tpl = None
+
+
+def _get_stats_tpl():
+    """Translated stats-line template, looked up once instead of per scan."""
+    global _stats_tpl
+    if _stats_tpl is None:
+        _stats_tpl = _(
+            "Language: {lang} — {translated}/{total} strings translated "
+            "({pct:.1f}%) — {files} .mo files — {outdated} outdated")
+    return _stats_tpl
+
+
+_main_menu = None
+
+
+def _get_main_menu():
+    """Build the hamburger menu model once and share it across windows."""
+    global _main_menu
+    if _main_menu is None:
+        _main_menu = Gio.Menu()
+        _main_menu.append(_("About"), "app.about")
+        _main_menu.append(_("Quit"), "app.quit")
+    return _main_menu
+
+
+_HEATMAP_CSS = b"""
+.heatmap-green { background-color: #26a269; color: white; border-radius: 8px; }
+.heatmap-yellow { background-color: #e5a50a; color: white; border-radius: 8px; }
+.heatmap-orange { background-color: #ff7800; color: white; border-radius: 8px; }
+.heatmap-red { background-color: #c01c28; color: white; border-radius: 8px; }
+.heatmap-gray { background-color: #77767b; color: white; border-radius: 8px; }
+"""
+
+_css_installed = False
+
 
 def _setup_heatmap_css():
-    css = b"""
-    .heatmap-green { background-color: #26a269; color: white; border-radius: 8px; }
-    .heatmap-yellow { background-color: #e5a50a; color: white; border-radius: 8px; }
-    .heatmap-orange { background-color: #ff7800; color: white; border-radius: 8px; }
-    .heatmap-red { background-color: #c01c28; color: white; border-radius: 8px; }
-    .heatmap-gray { background-color: #77767b; color: white; border-radius: 8px; }
-    """
+    # One provider per display, not one per window: repeated window
+    # opens must not grow the provider list every style resolution
+    # walks.
+    global _css_installed
+    if _css_installed:
+        return
     provider = Gtk.CssProvider()
-    provider.load_from_data(css)
+    provider.load_from_data(_HEATMAP_CSS)
     Gtk.StyleContext.add_provider_for_display(
         Gdk.Display.get_default(), provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+    _css_installed = True
+
+
+class MoFileItem(GObject.Object):
+    """GObject wrapper so MoFileInfo can live in a Gio.ListStore.
+
+    Items are built on the scanner thread, so all display strings and
+    CSS classes are derived here; the factory bind callbacks on the
+    main loop only assign precomputed values.
+    """
+
+    def __init__(self, mo: MoFileInfo):
+        super().__init__()
+        self.mo = mo
+        self.domain_lower = mo.domain.lower()
+        pct = mo.coverage_pct
+        self.counts_str = _get_counts_tpl().format(
+            translated=mo.translated, total=mo.total, pct=pct)
+        self.mtime_str = mo.mtime.strftime("%Y-%m-%d") if mo.mtime else ""
+        self.is_outdated = mo.is_outdated
+        self.pct_str = f"{pct:.0f}%"
+        self.heatmap_class = _heatmap_css_class(pct)
+        self.tooltip = f"{mo.domain}: {mo.translated}/{mo.total}"
+        if pct >= 90:
+            self.icon_name, self.icon_css = "emblem-ok-symbolic", "success"
+        elif pct >= 50:
+            self.icon_name, self.icon_css = "dialog-warning-symbolic", "warning"
+        else:
+            self.icon_name, self.icon_css = "dialog-error-symbolic", "error"
+
+
+# Indexed by pct // 10: red below 50, orange to 70, yellow to 90,
+# green from 90 up
+_HEATMAP_CLASSES = (["heatmap-red"] * 5 + ["heatmap-orange"] * 2
+                    + ["heatmap-yellow"] * 2 + ["heatmap-green"] * 2)
 
 
 def _heatmap_css_class(pct):
-    if pct >= 90: return "heatmap-green"
-    elif pct >= 70: return "heatmap-yellow"
-    elif pct >= 50: return "heatmap-orange"
-    elif pct > 0: return "heatmap-red"
-    return "heatmap-gray"
+    if pct <= 0:
+        return "heatmap-gray"
+    return _HEATMAP_CLASSES[min(int(pct) // 10, 10)]
 
 
 class LangpackInspectorWindow(Adw.ApplicationWindow):
@@ -58,10 +142,22 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
         self._mo_files: list[MoFileInfo] = []
         self._current_lang = get_system_language()
         self._heatmap_mode = False
+        self._filter_query = ""
+        self._filter_timeout_id = 0
+        self._pending_packs = None
+        self._last_status_stamp = None
+
+        # One long-lived scanner thread; requests carry a generation so
+        # stale results are ignored and bursts coalesce to the newest
+        self._scan_q = queue.Queue()
+        self._scan_gen = 0
+        threading.Thread(target=self._scan_loop, daemon=True).start()
 
         _setup_heatmap_css()
         self._build_ui()
-        GLib.idle_add(self._initial_scan)
+        # Start scanning right away so the worker runs while GTK does
+        # its initial layout; results land via idle_add in _scan_done.
+        self._start_scan()
 
     # ── UI Construction ──────────────────────────────────────────
 
@@ -82,10 +178,7 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
 
         # About button
         menu_btn = Gtk.MenuButton(icon_name="open-menu-symbolic")
-        menu = Gio.Menu()
-        menu.append(_("About"), "app.about")
-        menu.append(_("Quit"), "app.quit")
-        menu_btn.set_menu_model(menu)
+        menu_btn.set_menu_model(_get_main_menu())
         header.pack_end(menu_btn)
 
         # Theme toggle
@@ -152,6 +245,8 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
         self._packs_expander.set_margin_start(12)
         self._packs_expander.set_margin_end(12)
         self._packs_expander.set_margin_bottom(6)
+        self._packs_expander.connect("notify::expanded",
+                                     self._on_packs_expanded)
         self._packs_label = Gtk.Label(label="", xalign=0, wrap=True)
         self._packs_expander.set_child(self._packs_label)
         content_box.append(self._packs_expander)
@@ -159,7 +254,9 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
         # Separator
         content_box.append(Gtk.Separator())
 
-        # View stack for list/heatmap
+        # View stack for list/heatmap. Both pages render the same
+        # filtered model, and only the mapped page binds cells, so
+        # filter and scan updates never cost work on the hidden view.
         self._view_stack = Gtk.Stack()
         self._view_stack.set_vexpand(True)
         content_box.append(self._view_stack)
@@ -167,30 +264,51 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
         # Scrolled list of .mo files
         sw = Gtk.ScrolledWindow(vexpand=True)
 
-        self._listbox = Gtk.ListBox()
-        self._listbox.set_selection_mode(Gtk.SelectionMode.NONE)
-        self._listbox.add_css_class("boxed-list")
-        self._listbox.set_margin_start(12)
-        self._listbox.set_margin_end(12)
-        self._listbox.set_margin_top(6)
-        self._listbox.set_margin_bottom(12)
-        sw.set_child(self._listbox)
+        # ColumnView over a filtered model: the search filter runs in C
+        # and only visible cells get widgets.
+        self._store = Gio.ListStore.new(MoFileItem)
+        self._filter = Gtk.CustomFilter.new(self._item_match)
+        self._filter_model = Gtk.FilterListModel.new(self._store, self._filter)
+        self._columnview = Gtk.ColumnView.new(
+            Gtk.NoSelection.new(self._filter_model))
+        self._columnview.add_css_class("data-table")
+        self._columnview.set_margin_start(12)
+        self._columnview.set_margin_end(12)
+        self._columnview.set_margin_top(6)
+        self._columnview.set_margin_bottom(12)
+
+        self._columnview.append_column(self._make_status_column())
+        for title, expand, bind_func in (
+            (_("Domain"), True, self._bind_domain),
+            (_("Package"), False, self._bind_package),
+            (_("Translated"), False, self._bind_counts),
+            (_("Updated"), False, self._bind_updated),
+        ):
+            col = Gtk.ColumnViewColumn.new(
+                title, self._make_label_factory(bind_func))
+            col.set_expand(expand)
+            self._columnview.append_column(col)
+        self._columnview.append_column(self._make_link_column())
+
+        sw.set_child(self._columnview)
         self._view_stack.add_named(sw, "list")
 
-        # Heatmap view
+        # Heatmap view: a GridView on the same filtered model, so it
+        # recycles a viewport-sized pool of tiles and follows the
+        # search filter for free.
         hm_sw = Gtk.ScrolledWindow(vexpand=True)
-        self._heatmap_flow = Gtk.FlowBox()
-        self._heatmap_flow.set_selection_mode(Gtk.SelectionMode.NONE)
-        self._heatmap_flow.set_homogeneous(True)
-        self._heatmap_flow.set_min_children_per_line(4)
-        self._heatmap_flow.set_max_children_per_line(10)
-        self._heatmap_flow.set_column_spacing(4)
-        self._heatmap_flow.set_row_spacing(4)
-        self._heatmap_flow.set_margin_start(12)
-        self._heatmap_flow.set_margin_end(12)
-        self._heatmap_flow.set_margin_top(8)
-        self._heatmap_flow.set_margin_bottom(12)
-        hm_sw.set_child(self._heatmap_flow)
+        hm_factory = Gtk.SignalListItemFactory()
+        hm_factory.connect("setup", self._on_tile_setup)
+        hm_factory.connect("bind", self._on_tile_bind)
+        self._heatmap_grid = Gtk.GridView.new(
+            Gtk.NoSelection.new(self._filter_model), hm_factory)
+        self._heatmap_grid.set_min_columns(4)
+        self._heatmap_grid.set_max_columns(10)
+        self._heatmap_grid.set_margin_start(12)
+        self._heatmap_grid.set_margin_end(12)
+        self._heatmap_grid.set_margin_top(8)
+        self._heatmap_grid.set_margin_bottom(12)
+        hm_sw.set_child(self._heatmap_grid)
         self._view_stack.add_named(hm_sw, "heatmap")
 
         # Search/filter
@@ -248,10 +366,6 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
 
-    def _initial_scan(self):
-        self._start_scan()
-        return False
-
     def _on_refresh(self, *args):
         self._update_status_bar()
         self._start_scan()
@@ -262,51 +376,96 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
             self._start_scan()
 
     def _on_heatmap_toggled(self, btn):
+        # Both views share the filtered model, so toggling is just a
+        # stack switch
         self._heatmap_mode = btn.get_active()
-        if self._heatmap_mode:
-            self._rebuild_heatmap(self._mo_files)
-            self._view_stack.set_visible_child_name("heatmap")
-        else:
-            self._view_stack.set_visible_child_name("list")
+        self._view_stack.set_visible_child_name(
+            "heatmap" if self._heatmap_mode else "list")
 
     def _on_filter_changed(self, entry):
-        query = entry.get_text().lower()
-        filtered = ([m for m in self._mo_files if query in m.domain.lower()]
-                    if query else self._mo_files)
-        self._populate_list(filtered)
-        if self._heatmap_mode:
-            self._rebuild_heatmap(filtered)
+        # Debounce so bursts of typing collapse into one filter pass
+        if self._filter_timeout_id:
+            GLib.source_remove(self._filter_timeout_id)
+        self._filter_timeout_id = GLib.timeout_add(_FILTER_DEBOUNCE_MS,
+                                                   self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_timeout_id = 0
+        old_query = self._filter_query
+        new_query = self._search_entry.get_text().lower()
+        if new_query == old_query:
+            return GLib.SOURCE_REMOVE
+        self._filter_query = new_query
+        # Both views re-filter inside GTK; a precise hint lets it skip
+        # items that cannot have changed state. Appending to a substring
+        # query only narrows the match set, deleting only widens it.
+        if old_query in new_query:
+            change = Gtk.FilterChange.MORE_STRICT
+        elif new_query in old_query:
+            change = Gtk.FilterChange.LESS_STRICT
+        else:
+            change = Gtk.FilterChange.DIFFERENT
+        self._filter.changed(change)
+        return GLib.SOURCE_REMOVE
 
     def _start_scan(self):
         self._spinner.start()
         self._stats_label.set_text(_("Scanning…"))
 
-        lang = self._current_lang
-        thread = threading.Thread(target=self._scan_worker, args=(lang,), daemon=True)
-        thread.start()
+        self._scan_gen += 1
+        self._scan_q.put((self._current_lang, self._scan_gen))
 
-    def _scan_worker(self, lang: str):
-        packs = list_installed_langpacks()
-        mo_files = scan_language(lang)
-        stats = get_language_stats(mo_files)
-        GLib.idle_add(self._scan_done, packs, mo_files, stats, lang)
+    def _scan_loop(self):
+        while True:
+            lang, gen = self._scan_q.get()
+            # Coalesce queued-up requests; only the newest matters
+            try:
+                while True:
+                    lang, gen = self._scan_q.get_nowait()
+            except queue.Empty:
+                pass
+            # This thread serves every scan for the life of the window,
+            # so no exception may escape: a failed scan reports back and
+            # the loop keeps waiting for the next request.
+            try:
+                packs = list_installed_langpacks()
+                mo_files = scan_language(lang)
+                stats = get_language_stats(mo_files)
+                # Item construction (formatting, CSS classes) happens here
+                # on the worker; the main loop only splices and binds
+                items = [MoFileItem(m) for m in mo_files]
+            except Exception as e:
+                GLib.idle_add(self._scan_failed, str(e), gen,
+                              priority=GLib.PRIORITY_DEFAULT_IDLE)
+                continue
+            # Idle priority lets pending input and redraws run first, so
+            # delivering results never makes the UI stutter mid-frame.
+            GLib.idle_add(self._scan_done, packs, mo_files, items, stats,
+                          lang, gen, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _scan_failed(self, message, gen):
+        if gen != self._scan_gen:
+            return False
+        self._spinner.stop()
+        self._stats_label.set_text(_("Scan failed: %s") % message)
+        return False
 
-    def _scan_done(self, packs, mo_files, stats, lang):
+    def _scan_done(self, packs, mo_files, items, stats, lang, gen):
+        if gen != self._scan_gen:
+            return False  # a newer scan is underway; drop stale results
         self._spinner.stop()
         self._mo_files = mo_files
 
-        # Update packs list
+        # Update packs list; the wrapped label is only laid out when the
+        # expander is actually open, so defer text generation until then
         lang_packs = [p for p in packs if p.language == lang or lang in p.name]
-        if lang_packs:
-            txt = "\n".join(f"• {p.name} ({p.version})" for p in lang_packs)
-        else:
-            txt = _("No language packs found for '%s'") % lang
-        self._packs_label.set_text(txt)
+        self._pending_packs = (lang, lang_packs)
+        if self._packs_expander.get_expanded():
+            self._update_packs_label()
 
         # Update stats
         self._stats_label.set_text(
-            _("Language: {lang} — {translated}/{total} strings translated "
-              "({pct:.1f}%) — {files} .mo files — {outdated} outdated").format(
+            _get_stats_tpl().format(
                 lang=lang,
                 translated=stats["translated"],
                 total=stats["total_strings"],
@@ -316,107 +475,154 @@ class LangpackInspectorWindow(Adw.ApplicationWindow):
             )
         )
 
-        self._populate_list(mo_files)
-        if self._heatmap_mode:
-            self._rebuild_heatmap(mo_files)
+        self._populate_list(items)
         return False
 
-    def _rebuild_heatmap(self, mo_files: list[MoFileInfo]):
-        while True:
-            child = self._heatmap_flow.get_first_child()
-            if child is None:
-                break
-            self._heatmap_flow.remove(child)
-        for mo in mo_files:
-            box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
-            box.set_size_request(120, 56)
-            box.add_css_class(_heatmap_css_class(mo.coverage_pct))
-            box.set_margin_start(3)
-            box.set_margin_end(3)
-            box.set_margin_top(3)
-            box.set_margin_bottom(3)
-            lbl = Gtk.Label(label=mo.domain)
-            lbl.set_ellipsize(Pango.EllipsizeMode.END)
-            lbl.set_max_width_chars(16)
-            lbl.set_margin_top(4)
-            lbl.set_margin_start(4)
-            lbl.set_margin_end(4)
-            box.append(lbl)
-            pct_lbl = Gtk.Label(label=f"{mo.coverage_pct:.0f}%")
-            pct_lbl.set_margin_bottom(4)
-            box.append(pct_lbl)
-            box.set_tooltip_text(f"{mo.domain}: {mo.translated}/{mo.total}")
-            self._heatmap_flow.append(box)
-
-    def _populate_list(self, mo_files: list[MoFileInfo]):
-        # Clear
-        while True:
-            row = self._listbox.get_row_at_index(0)
-            if row is None:
-                break
-            self._listbox.remove(row)
-
-        for mo in mo_files:
-            row = self._create_mo_row(mo)
-            self._listbox.append(row)
-
-    def _create_mo_row(self, mo: MoFileInfo) -> Gtk.ListBoxRow:
-        row = Adw.ActionRow()
-        row.set_title(mo.domain)
-
-        subtitle_parts = []
-        if mo.package:
-            subtitle_parts.append(mo.package)
-        subtitle_parts.append(
-            _("{translated}/{total} ({pct:.0f}%)").format(
-                translated=mo.translated,
-                total=mo.total,
-                pct=mo.coverage_pct,
-            )
-        )
-        if mo.mtime:
-            subtitle_parts.append(mo.mtime.strftime("%Y-%m-%d"))
-        row.set_subtitle(" · ".join(subtitle_parts))
-
-        # Coverage indicator
-        if mo.coverage_pct >= 90:
-            icon_name = "emblem-ok-symbolic"
-            css = "success"
-        elif mo.coverage_pct >= 50:
-            icon_name = "dialog-warning-symbolic"
-            css = "warning"
+    def _on_packs_expanded(self, expander, _pspec):
+        if expander.get_expanded():
+            self._update_packs_label()
+
+    def _update_packs_label(self):
+        if self._pending_packs is None:
+            return
+        lang, lang_packs = self._pending_packs
+        self._pending_packs = None
+        if lang_packs:
+            txt = "\n".join(f"• {p.name} ({p.version})" for p in lang_packs)
         else:
-            icon_name = "dialog-error-symbolic"
-            css = "error"
-
-        icon = Gtk.Image.new_from_icon_name(icon_name)
-        icon.add_css_class(css)
-        row.add_prefix(icon)
-
-        # Outdated badge
-        if mo.is_outdated:
-            badge = Gtk.Label(label=_("old"))
-            badge.add_css_class("error")
-            badge.set_valign(Gtk.Align.CENTER)
-            row.add_suffix(badge)
-
-        # Launchpad link button
-        if mo.launchpad_url:
-            link_btn = Gtk.LinkButton(uri=mo.launchpad_url)
-            link_btn.set_label(_("Translate"))
+            txt = _("No language packs found for '%s'") % lang
+        self._packs_label.set_text(txt)
+
+    def _on_tile_setup(self, factory, list_item):
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        box.set_size_request(120, 56)
+        box.set_margin_start(3)
+        box.set_margin_end(3)
+        box.set_margin_top(3)
+        box.set_margin_bottom(3)
+        lbl = Gtk.Label()
+        lbl.set_ellipsize(Pango.EllipsizeMode.END)
+        lbl.set_max_width_chars(16)
+        lbl.set_margin_top(4)
+        lbl.set_margin_start(4)
+        lbl.set_margin_end(4)
+        box.append(lbl)
+        pct_lbl = Gtk.Label()
+        pct_lbl.set_margin_bottom(4)
+        box.append(pct_lbl)
+        box._lbl = lbl
+        box._pct_lbl = pct_lbl
+        box._css = None
+        list_item.set_child(box)
+
+    def _on_tile_bind(self, factory, list_item):
+        box = list_item.get_child()
+        item = list_item.get_item()
+        if box._css and box._css != item.heatmap_class:
+            box.remove_css_class(box._css)
+        box.add_css_class(item.heatmap_class)
+        box._css = item.heatmap_class
+        box._lbl.set_label(item.mo.domain)
+        box._pct_lbl.set_label(item.pct_str)
+        box.set_tooltip_text(item.tooltip)
+
+    def _populate_list(self, items: list[MoFileItem]):
+        # Single C-side model update emitting one items-changed; both
+        # views rebind recycled cells from it, so there is no per-row
+        # signal or style churn to freeze around.
+        self._store.splice(0, self._store.get_n_items(), items)
+
+    def _item_match(self, item):
+        return self._filter_query in item.domain_lower
+
+    def _make_label_factory(self, bind_func):
+        factory = Gtk.SignalListItemFactory()
+
+        def setup(_factory, list_item):
+            label = Gtk.Label(xalign=0)
+            label.set_ellipsize(Pango.EllipsizeMode.END)
+            list_item.set_child(label)
+
+        def bind(_factory, list_item):
+            bind_func(list_item.get_child(), list_item.get_item())
+
+        factory.connect("setup", setup)
+        factory.connect("bind", bind)
+        return factory
+
+    def _bind_domain(self, label, item):
+        label.set_label(item.mo.domain)
+
+    def _bind_package(self, label, item):
+        label.set_label(item.mo.package)
+
+    def _bind_counts(self, label, item):
+        label.set_label(item.counts_str)
+
+    def _bind_updated(self, label, item):
+        label.set_label(item.mtime_str)
+        if item.is_outdated:
+            label.add_css_class("error")
+        else:
+            label.remove_css_class("error")
+
+    def _make_status_column(self):
+        factory = Gtk.SignalListItemFactory()
+
+        def setup(_factory, list_item):
+            icon = Gtk.Image()
+            icon._css = None
+            list_item.set_child(icon)
+
+        def bind(_factory, list_item):
+            icon = list_item.get_child()
+            item = list_item.get_item()
+            # Coverage indicator
+            if icon._css and icon._css != item.icon_css:
+                icon.remove_css_class(icon._css)
+            icon.set_from_icon_name(item.icon_name)
+            icon.add_css_class(item.icon_css)
+            icon._css = item.icon_css
+
+        factory.connect("setup", setup)
+        factory.connect("bind", bind)
+        return Gtk.ColumnViewColumn.new("", factory)
+
+    def _make_link_column(self):
+        factory = Gtk.SignalListItemFactory()
+
+        def setup(_factory, list_item):
+            link_btn = Gtk.LinkButton(label=_("Translate"))
             link_btn.set_valign(Gtk.Align.CENTER)
-            row.add_suffix(link_btn)
+            list_item.set_child(link_btn)
+
+        def bind(_factory, list_item):
+            link_btn = list_item.get_child()
+            mo = list_item.get_item().mo
+            link_btn.set_visible(bool(mo.launchpad_url))
+            if mo.launchpad_url:
+                link_btn.set_uri(mo.launchpad_url)
 
-        return row
+        factory.connect("setup", setup)
+        factory.connect("bind", bind)
+        return Gtk.ColumnViewColumn.new("", factory)
 
     def _on_theme_toggle(self, _btn):
+        # Track the mode ourselves; reading get_color_scheme() back can
+        # involve a portal round-trip under Flatpak.
+        self._dark = not getattr(self, "_dark", False)
         sm = Adw.StyleManager.get_default()
-        if sm.get_color_scheme() == Adw.ColorScheme.FORCE_DARK:
-            sm.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
-            self._theme_btn.set_icon_name("weather-clear-night-symbolic")
-        else:
+        if self._dark:
             sm.set_color_scheme(Adw.ColorScheme.FORCE_DARK)
             self._theme_btn.set_icon_name("weather-clear-symbolic")
+        else:
+            sm.set_color_scheme(Adw.ColorScheme.FORCE_LIGHT)
+            self._theme_btn.set_icon_name("weather-clear-night-symbolic")
 
     def _update_status_bar(self):
-        self._status_bar.set_text("Last updated: " + _dt_now.now().strftime("%Y-%m-%d %H:%M"))
+        stamp = time.strftime("%Y-%m-%d %H:%M")
+        # Skip the label update while the minute is unchanged
+        if stamp == self._last_status_stamp:
+            return
+        self._last_status_stamp = stamp
+        self._status_bar.set_text("Last updated: " + stamp)